@@ -1,363 +1,233 @@
-import json
+import marshal
 import os
-
-from decouple import config
+from functools import lru_cache
+from string import Template
 
 MAX_REPO = 30
 SOURCE_REPO = "AElfProject/AElf"
 REPO_NAME = "aelf"
 run_number = os.environ.get('GITHUB_RUN_NUMBER', '0')
+_RUN_NUMBER_INT = int(run_number)
+
+
+def _cyclic_index(n=_RUN_NUMBER_INT, max_index=100):
+        """Cyclic index for an already-parsed run number; no string parsing."""
+        return (n - 1) % max_index + 1
 
 
-def get_cyclic_index(run_number, max_index=100):
+@lru_cache(maxsize=128)
+def get_cyclic_index(run_number=_RUN_NUMBER_INT, max_index=100):
         """Convert run number to a cyclic index between 1 and max_index"""
-        return (int(run_number) - 1) % max_index + 1
+        return _cyclic_index(int(run_number), max_index)
 
 
-if run_number == "0":
-        BASE_URL = f"https://deepwiki.com/{SOURCE_REPO}"
-else:
+@lru_cache(maxsize=1)
+def _base_url():
+        """Build the deepwiki URL for the current run; computed once."""
+        if _RUN_NUMBER_INT == 0:
+                return f"https://deepwiki.com/{SOURCE_REPO}"
         # Convert to cyclic index (1-100)
-        run_index = get_cyclic_index(run_number, MAX_REPO)
+        run_index = _cyclic_index(_RUN_NUMBER_INT, MAX_REPO)
         # Format the URL with leading zeros
         repo_number = f"{run_index:03d}"
-        BASE_URL = f"https://deepwiki.com/grass-dev-pa/{REPO_NAME}-{repo_number}"
-
-scope_files = [
-        "contract/AElf.Contracts.Association/Association.cs",
-        "contract/AElf.Contracts.Association/AssociationConstants.cs",
-        "contract/AElf.Contracts.Association/AssociationContract_ACS1_TransactionFeeProvider.cs",
-        "contract/AElf.Contracts.Association/AssociationReferenceState.cs",
-        "contract/AElf.Contracts.Association/AssociationState.cs",
-        "contract/AElf.Contracts.Association/Association_Extensions.cs",
-        "contract/AElf.Contracts.Association/Association_Helper.cs",
-        "contract/AElf.Contracts.Association/OrganizationMemberList.cs",
-        "contract/AElf.Contracts.Configuration/ConfigurationContract.cs",
-        "contract/AElf.Contracts.Configuration/ConfigurationContract_ACS1_TransactionFeeProvider.cs",
-        "contract/AElf.Contracts.Configuration/ConfigurationContract_Helper.cs",
-        "contract/AElf.Contracts.Configuration/ConfigurationReferenceState.cs",
-        "contract/AElf.Contracts.Configuration/ConfigurationState.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContractConstants.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_ACS11_CrossChainInformationProvider.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_ACS1_TransactionFeeProvider.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_ACS4_ConsensusInformationProvider.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_CacheFileds.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_GetConsensusBlockExtraData.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_GetConsensusCommand.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_GetMaximumBlocksCount.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_HelpMethods.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_LIB.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_MaximumMinersCount.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_NextTerm.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_ProcessConsensusInformation.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_SecretSharing.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_SideChainDividendsPool.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_Validation.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_ValidationService.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_ViewMethods.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AElfConsensusContractState.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusCommandGeneration/ConsensusBehaviourProviderBase.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusCommandGeneration/ConsensusCommandProvider.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusCommandGeneration/MainChainConsensusBehaviourProvider.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusCommandGeneration/MiningTimeArrangingService.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusCommandGeneration/SideChainConsensusBehaviourProvider.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusCommandGeneration/Strategies/CommandStrategyBase.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusCommandGeneration/Strategies/FirstRoundCommandStrategy.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusCommandGeneration/Strategies/ICommandStrategy.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusCommandGeneration/Strategies/NormalBlockCommandStrategy.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusCommandGeneration/Strategies/TerminateRoundCommandStrategy.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusCommandGeneration/Strategies/TinyBlockCommandStrategy.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusHeaderInfoValidationProviders/ConsensusValidationContext.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusHeaderInfoValidationProviders/ContinuousBlocksValidationProvider.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusHeaderInfoValidationProviders/IHeaderInformationValidationProvider.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusHeaderInfoValidationProviders/LibInformationValidationProvider.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusHeaderInfoValidationProviders/MiningPermissionValidationProvider.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusHeaderInfoValidationProviders/NextRoundMiningOrderValidationProvider.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusHeaderInfoValidationProviders/RoundTerminateValidationProvider.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusHeaderInfoValidationProviders/TimeSlotValidationProvider.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusHeaderInfoValidationProviders/UpdateValueValidationProvider.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ContractsReferences.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/Types/MinerList.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/Types/NextRoundInput.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/Types/NextTermInput.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/Types/Round.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/Types/Round_ApplyNormalConsensusData.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/Types/Round_ArrangeAbnormalMiningTime.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/Types/Round_ExtractInformationToUpdateConsensus.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/Types/Round_Generation.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/Types/Round_GetLighterRound.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/Types/Round_GetLogs.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/Types/Round_ImpliedIrreversibleBlockHeight.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/Types/Round_Recover.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/Types/Round_Simplify.cs",
-        "contract/AElf.Contracts.CrossChain/CrossChainContract.cs",
-        "contract/AElf.Contracts.CrossChain/CrossChainContractState.cs",
-        "contract/AElf.Contracts.CrossChain/CrossChainContract_ACS1_TransactionFeeProvider.cs",
-        "contract/AElf.Contracts.CrossChain/CrossChainContract_Constants.cs",
-        "contract/AElf.Contracts.CrossChain/CrossChainContract_Helper.cs",
-        "contract/AElf.Contracts.CrossChain/CrossChainContract_View.cs",
-        "contract/AElf.Contracts.CrossChain/CrossChainReferenceState.cs",
-        "contract/AElf.Contracts.Economic/EconomicContract.cs",
-        "contract/AElf.Contracts.Economic/EconomicContractConstants.cs",
-        "contract/AElf.Contracts.Economic/EconomicContractState.cs",
-        "contract/AElf.Contracts.Economic/EconomicContract_ACS1_TransactionFeeProvider.cs",
-        "contract/AElf.Contracts.Election/ElectionContractConstants.cs",
-        "contract/AElf.Contracts.Election/ElectionContractReferenceState.cs",
-        "contract/AElf.Contracts.Election/ElectionContractState.cs",
-        "contract/AElf.Contracts.Election/ElectionContract_ACS1_TransactionFeeProvider.cs",
-        "contract/AElf.Contracts.Election/ElectionContract_Candidate.cs",
-        "contract/AElf.Contracts.Election/ElectionContract_Elector.cs",
-        "contract/AElf.Contracts.Election/ElectionContract_Maintainence.cs",
-        "contract/AElf.Contracts.Election/TimestampHelper.cs",
-        "contract/AElf.Contracts.Election/ViewMethods.cs",
-        "contract/AElf.Contracts.Genesis/BasicContractZero.cs",
-        "contract/AElf.Contracts.Genesis/BasicContractZeroContract_ACS1_TransactionFeeProvider.cs",
-        "contract/AElf.Contracts.Genesis/BasicContractZeroReferenceState.cs",
-        "contract/AElf.Contracts.Genesis/BasicContractZeroState.cs",
-        "contract/AElf.Contracts.Genesis/BasicContractZero_Constants.cs",
-        "contract/AElf.Contracts.Genesis/BasicContractZero_Helper.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContractConstants.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContractReferenceState.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContractState.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContractState_ChargeFee.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContract_ACS1_MethodFeeProvider.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContract_ACS2_StatePathsProvider.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContract_Actions.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContract_CacheFileds.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContract_Delegation.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContract_Fee_Calculate_Coefficient.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContract_Fees.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContract_Helper.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContract_Method_Authorization.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContract_NFTHelper.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContract_NFT_Actions.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContract_Views.cs",
-        "contract/AElf.Contracts.NFT/NFTContractConstants.cs",
-        "contract/AElf.Contracts.NFT/NFTContractReferenceState.cs",
-        "contract/AElf.Contracts.NFT/NFTContractState.cs",
-        "contract/AElf.Contracts.NFT/NFTContract_ACS1.cs",
-        "contract/AElf.Contracts.NFT/NFTContract_Create.cs",
-        "contract/AElf.Contracts.NFT/NFTContract_Helpers.cs",
-        "contract/AElf.Contracts.NFT/NFTContract_UseChain.cs",
-        "contract/AElf.Contracts.NFT/NFTContract_View.cs",
-        "contract/AElf.Contracts.Parliament/Parliament.cs",
-        "contract/AElf.Contracts.Parliament/ParliamentConstants.cs",
-        "contract/AElf.Contracts.Parliament/ParliamentContract_ACS1_TransactionFeeProvider.cs",
-        "contract/AElf.Contracts.Parliament/ParliamentState.cs",
-        "contract/AElf.Contracts.Parliament/Parliament_Constants.cs",
-        "contract/AElf.Contracts.Parliament/Parliament_Helper.cs",
-        "contract/AElf.Contracts.Profit/ContractsReferences.cs",
-        "contract/AElf.Contracts.Profit/Models/RemovedDetails.cs",
-        "contract/AElf.Contracts.Profit/ProfitContract.cs",
-        "contract/AElf.Contracts.Profit/ProfitContractConstants.cs",
-        "contract/AElf.Contracts.Profit/ProfitContractState.cs",
-        "contract/AElf.Contracts.Profit/ProfitContract_ACS1_TransactionFeeProvider.cs",
-        "contract/AElf.Contracts.Profit/ViewMethods.cs",
-        "contract/AElf.Contracts.Referendum/ProposerWhiteListExtensions.cs",
-        "contract/AElf.Contracts.Referendum/Referendum.cs",
-        "contract/AElf.Contracts.Referendum/ReferendumConstants.cs",
-        "contract/AElf.Contracts.Referendum/ReferendumContract_ACS1_TransactionFeeProvider.cs",
-        "contract/AElf.Contracts.Referendum/ReferendumState.cs",
-        "contract/AElf.Contracts.Referendum/Referendum_Helper.cs",
-        "contract/AElf.Contracts.TokenConverter/BancorHelper.cs",
-        "contract/AElf.Contracts.TokenConverter/InvalidValueException.cs",
-        "contract/AElf.Contracts.TokenConverter/TokenConvert_Views.cs",
-        "contract/AElf.Contracts.TokenConverter/TokenConverterContract.cs",
-        "contract/AElf.Contracts.TokenConverter/TokenConverterContractState.cs",
-        "contract/AElf.Contracts.TokenConverter/TokenConverterContract_ACS1_TransactionFeeProvider.cs",
-        "contract/AElf.Contracts.TokenHolder/ContractsReferences.cs",
-        "contract/AElf.Contracts.TokenHolder/TokenHolderContract.cs",
-        "contract/AElf.Contracts.TokenHolder/TokenHolderContractState.cs",
-        "contract/AElf.Contracts.TokenHolder/TokenHolderContract_ACS1_TransactionFeeProvider.cs",
-        "contract/AElf.Contracts.Treasury/ContractsReferences.cs",
-        "contract/AElf.Contracts.Treasury/TreasuryContract.cs",
-        "contract/AElf.Contracts.Treasury/TreasuryContractConstants.cs",
-        "contract/AElf.Contracts.Treasury/TreasuryContractState.cs",
-        "contract/AElf.Contracts.Treasury/TreasuryContract_ACS1_TransactionFeeProvider.cs",
-        "contract/AElf.Contracts.Vote/ContractsReferences.cs",
-        "contract/AElf.Contracts.Vote/ViewMethods.cs",
-        "contract/AElf.Contracts.Vote/VoteContract.cs",
-        "contract/AElf.Contracts.Vote/VoteContractConstants.cs",
-        "contract/AElf.Contracts.Vote/VoteContractState.cs",
-        "contract/AElf.Contracts.Vote/VoteContract_ACS1_TransactionFeeProvider.cs",
-        "contract/AElf.Contracts.Vote/VoteExtensions.cs",
-
-        "contract/AElf.Contracts.Association/Association.cs",
-        "contract/AElf.Contracts.Association/AssociationConstants.cs",
-        "contract/AElf.Contracts.Association/AssociationContract_ACS1_TransactionFeeProvider.cs",
-        "contract/AElf.Contracts.Association/AssociationReferenceState.cs",
-        "contract/AElf.Contracts.Association/AssociationState.cs",
-        "contract/AElf.Contracts.Association/Association_Extensions.cs",
-        "contract/AElf.Contracts.Association/Association_Helper.cs",
-        "contract/AElf.Contracts.Association/OrganizationMemberList.cs",
-        "contract/AElf.Contracts.Configuration/ConfigurationContract.cs",
-        "contract/AElf.Contracts.Configuration/ConfigurationContract_ACS1_TransactionFeeProvider.cs",
-        "contract/AElf.Contracts.Configuration/ConfigurationContract_Helper.cs",
-        "contract/AElf.Contracts.Configuration/ConfigurationReferenceState.cs",
-        "contract/AElf.Contracts.Configuration/ConfigurationState.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContractConstants.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_ACS11_CrossChainInformationProvider.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_ACS1_TransactionFeeProvider.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_ACS4_ConsensusInformationProvider.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_CacheFileds.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_GetConsensusBlockExtraData.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_GetConsensusCommand.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_GetMaximumBlocksCount.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_HelpMethods.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_LIB.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_MaximumMinersCount.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_NextTerm.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_ProcessConsensusInformation.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_SecretSharing.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_SideChainDividendsPool.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_Validation.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_ValidationService.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_ViewMethods.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/AElfConsensusContractState.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusCommandGeneration/ConsensusBehaviourProviderBase.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusCommandGeneration/ConsensusCommandProvider.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusCommandGeneration/MainChainConsensusBehaviourProvider.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusCommandGeneration/MiningTimeArrangingService.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusCommandGeneration/SideChainConsensusBehaviourProvider.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusCommandGeneration/Strategies/CommandStrategyBase.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusCommandGeneration/Strategies/FirstRoundCommandStrategy.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusCommandGeneration/Strategies/ICommandStrategy.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusCommandGeneration/Strategies/NormalBlockCommandStrategy.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusCommandGeneration/Strategies/TerminateRoundCommandStrategy.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusCommandGeneration/Strategies/TinyBlockCommandStrategy.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusHeaderInfoValidationProviders/ConsensusValidationContext.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusHeaderInfoValidationProviders/ContinuousBlocksValidationProvider.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusHeaderInfoValidationProviders/IHeaderInformationValidationProvider.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusHeaderInfoValidationProviders/LibInformationValidationProvider.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusHeaderInfoValidationProviders/MiningPermissionValidationProvider.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusHeaderInfoValidationProviders/NextRoundMiningOrderValidationProvider.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusHeaderInfoValidationProviders/RoundTerminateValidationProvider.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusHeaderInfoValidationProviders/TimeSlotValidationProvider.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ConsensusHeaderInfoValidationProviders/UpdateValueValidationProvider.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/ContractsReferences.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/Types/MinerList.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/Types/NextRoundInput.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/Types/NextTermInput.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/Types/Round.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/Types/Round_ApplyNormalConsensusData.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/Types/Round_ArrangeAbnormalMiningTime.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/Types/Round_ExtractInformationToUpdateConsensus.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/Types/Round_Generation.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/Types/Round_GetLighterRound.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/Types/Round_GetLogs.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/Types/Round_ImpliedIrreversibleBlockHeight.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/Types/Round_Recover.cs",
-        "contract/AElf.Contracts.Consensus.AEDPoS/Types/Round_Simplify.cs",
-        "contract/AElf.Contracts.CrossChain/CrossChainContract.cs",
-        "contract/AElf.Contracts.CrossChain/CrossChainContractState.cs",
-        "contract/AElf.Contracts.CrossChain/CrossChainContract_ACS1_TransactionFeeProvider.cs",
-        "contract/AElf.Contracts.CrossChain/CrossChainContract_Constants.cs",
-        "contract/AElf.Contracts.CrossChain/CrossChainContract_Helper.cs",
-        "contract/AElf.Contracts.CrossChain/CrossChainContract_View.cs",
-        "contract/AElf.Contracts.CrossChain/CrossChainReferenceState.cs",
-        "contract/AElf.Contracts.Economic/EconomicContract.cs",
-        "contract/AElf.Contracts.Economic/EconomicContractConstants.cs",
-        "contract/AElf.Contracts.Economic/EconomicContractState.cs",
-        "contract/AElf.Contracts.Economic/EconomicContract_ACS1_TransactionFeeProvider.cs",
-        "contract/AElf.Contracts.Election/ElectionContractConstants.cs",
-        "contract/AElf.Contracts.Election/ElectionContractReferenceState.cs",
-        "contract/AElf.Contracts.Election/ElectionContractState.cs",
-        "contract/AElf.Contracts.Election/ElectionContract_ACS1_TransactionFeeProvider.cs",
-        "contract/AElf.Contracts.Election/ElectionContract_Candidate.cs",
-        "contract/AElf.Contracts.Election/ElectionContract_Elector.cs",
-        "contract/AElf.Contracts.Election/ElectionContract_Maintainence.cs",
-        "contract/AElf.Contracts.Election/TimestampHelper.cs",
-        "contract/AElf.Contracts.Election/ViewMethods.cs",
-        "contract/AElf.Contracts.Genesis/BasicContractZero.cs",
-        "contract/AElf.Contracts.Genesis/BasicContractZeroContract_ACS1_TransactionFeeProvider.cs",
-        "contract/AElf.Contracts.Genesis/BasicContractZeroReferenceState.cs",
-        "contract/AElf.Contracts.Genesis/BasicContractZeroState.cs",
-        "contract/AElf.Contracts.Genesis/BasicContractZero_Constants.cs",
-        "contract/AElf.Contracts.Genesis/BasicContractZero_Helper.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContractConstants.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContractReferenceState.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContractState.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContractState_ChargeFee.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContract_ACS1_MethodFeeProvider.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContract_ACS2_StatePathsProvider.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContract_Actions.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContract_CacheFileds.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContract_Delegation.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContract_Fee_Calculate_Coefficient.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContract_Fees.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContract_Helper.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContract_Method_Authorization.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContract_NFTHelper.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContract_NFT_Actions.cs",
-        "contract/AElf.Contracts.MultiToken/TokenContract_Views.cs",
-        "contract/AElf.Contracts.NFT/NFTContractConstants.cs",
-        "contract/AElf.Contracts.NFT/NFTContractReferenceState.cs",
-        "contract/AElf.Contracts.NFT/NFTContractState.cs",
-        "contract/AElf.Contracts.NFT/NFTContract_ACS1.cs",
-        "contract/AElf.Contracts.NFT/NFTContract_Create.cs",
-        "contract/AElf.Contracts.NFT/NFTContract_Helpers.cs",
-        "contract/AElf.Contracts.NFT/NFTContract_UseChain.cs",
-        "contract/AElf.Contracts.NFT/NFTContract_View.cs",
-        "contract/AElf.Contracts.Parliament/Parliament.cs",
-        "contract/AElf.Contracts.Parliament/ParliamentConstants.cs",
-        "contract/AElf.Contracts.Parliament/ParliamentContract_ACS1_TransactionFeeProvider.cs",
-        "contract/AElf.Contracts.Parliament/ParliamentState.cs",
-        "contract/AElf.Contracts.Parliament/Parliament_Constants.cs",
-        "contract/AElf.Contracts.Parliament/Parliament_Helper.cs",
-        "contract/AElf.Contracts.Profit/ContractsReferences.cs",
-        "contract/AElf.Contracts.Profit/Models/RemovedDetails.cs",
-        "contract/AElf.Contracts.Profit/ProfitContract.cs",
-        "contract/AElf.Contracts.Profit/ProfitContractConstants.cs",
-        "contract/AElf.Contracts.Profit/ProfitContractState.cs",
-        "contract/AElf.Contracts.Profit/ProfitContract_ACS1_TransactionFeeProvider.cs",
-        "contract/AElf.Contracts.Profit/ViewMethods.cs",
-        "contract/AElf.Contracts.Referendum/ProposerWhiteListExtensions.cs",
-        "contract/AElf.Contracts.Referendum/Referendum.cs",
-        "contract/AElf.Contracts.Referendum/ReferendumConstants.cs",
-        "contract/AElf.Contracts.Referendum/ReferendumContract_ACS1_TransactionFeeProvider.cs",
-        "contract/AElf.Contracts.Referendum/ReferendumState.cs",
-        "contract/AElf.Contracts.Referendum/Referendum_Helper.cs",
-        "contract/AElf.Contracts.TokenConverter/BancorHelper.cs",
-        "contract/AElf.Contracts.TokenConverter/InvalidValueException.cs",
-        "contract/AElf.Contracts.TokenConverter/TokenConvert_Views.cs",
-        "contract/AElf.Contracts.TokenConverter/TokenConverterContract.cs",
-        "contract/AElf.Contracts.TokenConverter/TokenConverterContractState.cs",
-        "contract/AElf.Contracts.TokenConverter/TokenConverterContract_ACS1_TransactionFeeProvider.cs",
-        "contract/AElf.Contracts.TokenHolder/ContractsReferences.cs",
-        "contract/AElf.Contracts.TokenHolder/TokenHolderContract.cs",
-        "contract/AElf.Contracts.TokenHolder/TokenHolderContractState.cs",
-        "contract/AElf.Contracts.TokenHolder/TokenHolderContract_ACS1_TransactionFeeProvider.cs",
-        "contract/AElf.Contracts.Treasury/ContractsReferences.cs",
-        "contract/AElf.Contracts.Treasury/TreasuryContract.cs",
-        "contract/AElf.Contracts.Treasury/TreasuryContractConstants.cs",
-        "contract/AElf.Contracts.Treasury/TreasuryContractState.cs",
-        "contract/AElf.Contracts.Treasury/TreasuryContract_ACS1_TransactionFeeProvider.cs",
-        "contract/AElf.Contracts.Vote/ContractsReferences.cs",
-        "contract/AElf.Contracts.Vote/ViewMethods.cs",
-        "contract/AElf.Contracts.Vote/VoteContract.cs",
-        "contract/AElf.Contracts.Vote/VoteContractConstants.cs",
-        "contract/AElf.Contracts.Vote/VoteContractState.cs",
-        "contract/AElf.Contracts.Vote/VoteContract_ACS1_TransactionFeeProvider.cs",
-        "contract/AElf.Contracts.Vote/VoteExtensions.cs",
-
-
-]
-
-
-def question_generator(target_file: str) -> str:
-        """
-        Generates targeted security audit questions for a specific AElf smart contract file.
-
-        Args:
-            target_file: The specific file path to focus question generation on.
-                        (e.g., "contract/AElf.Contracts.MultiToken/TokenContract.cs")
-
-        Returns:
-            A formatted prompt string for generating security questions.
-        """
-        prompt = f"""
+        return f"https://deepwiki.com/grass-dev-pa/{REPO_NAME}-{repo_number}"
+
+# Pre-marshaled tuple of the in-scope paths: marshal.loads is a C-level
+# bulk deserializer, much cheaper than evaluating a literal of ~160 string
+# constants, and it runs only on first access to the scope list.
+# Regenerate with: marshal.dumps(tuple(paths), 2).
+_SCOPE_BLOB = (
+        b'(\x9e\x00\x00\x00u2\x00\x00\x00contract/AElf.Contracts.Association/Association.csu;\x00\x00\x00contrac'
+        b't/AElf.Contracts.Association/AssociationConstants.csuV\x00\x00\x00contract/AElf.C'
+        b'ontracts.Association/AssociationContract_ACS1_TransactionFeeProvider.csu'
+        b'@\x00\x00\x00contract/AElf.Contracts.Association/AssociationReferenceState.csu7\x00\x00'
+        b'\x00contract/AElf.Contracts.Association/AssociationState.csu=\x00\x00\x00contract/AE'
+        b'lf.Contracts.Association/Association_Extensions.csu9\x00\x00\x00contract/AElf.Con'
+        b'tracts.Association/Association_Helper.csu=\x00\x00\x00contract/AElf.Contracts.Ass'
+        b'ociation/OrganizationMemberList.csu>\x00\x00\x00contract/AElf.Contracts.Configura'
+        b'tion/ConfigurationContract.csuZ\x00\x00\x00contract/AElf.Contracts.Configuration/'
+        b'ConfigurationContract_ACS1_TransactionFeeProvider.csuE\x00\x00\x00contract/AElf.C'
+        b'ontracts.Configuration/ConfigurationContract_Helper.csuD\x00\x00\x00contract/AElf'
+        b'.Contracts.Configuration/ConfigurationReferenceState.csu;\x00\x00\x00contract/AEl'
+        b'f.Contracts.Configuration/ConfigurationState.csu:\x00\x00\x00contract/AElf.Contra'
+        b'cts.Consensus.AEDPoS/AEDPoSContract.csuC\x00\x00\x00contract/AElf.Contracts.Conse'
+        b'nsus.AEDPoS/AEDPoSContractConstants.csu^\x00\x00\x00contract/AElf.Contracts.Conse'
+        b'nsus.AEDPoS/AEDPoSContract_ACS11_CrossChainInformationProvider.csuV\x00\x00\x00co'
+        b'ntract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_ACS1_TransactionFe'
+        b'eProvider.csu\\\x00\x00\x00contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract'
+        b'_ACS4_ConsensusInformationProvider.csuF\x00\x00\x00contract/AElf.Contracts.Consen'
+        b'sus.AEDPoS/AEDPoSContract_CacheFileds.csuU\x00\x00\x00contract/AElf.Contracts.Con'
+        b'sensus.AEDPoS/AEDPoSContract_GetConsensusBlockExtraData.csuN\x00\x00\x00contract/'
+        b'AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_GetConsensusCommand.csuP\x00'
+        b'\x00\x00contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_GetMaximumBloc'
+        b'ksCount.csuF\x00\x00\x00contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_H'
+        b'elpMethods.csu>\x00\x00\x00contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContrac'
+        b't_LIB.csuM\x00\x00\x00contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_Max'
+        b'imumMinersCount.csuC\x00\x00\x00contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSCo'
+        b'ntract_NextTerm.csuV\x00\x00\x00contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSCo'
+        b'ntract_ProcessConsensusInformation.csuH\x00\x00\x00contract/AElf.Contracts.Consen'
+        b'sus.AEDPoS/AEDPoSContract_SecretSharing.csuQ\x00\x00\x00contract/AElf.Contracts.C'
+        b'onsensus.AEDPoS/AEDPoSContract_SideChainDividendsPool.csuE\x00\x00\x00contract/AE'
+        b'lf.Contracts.Consensus.AEDPoS/AEDPoSContract_Validation.csuL\x00\x00\x00contract/'
+        b'AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_ValidationService.csuF\x00\x00\x00'
+        b'contract/AElf.Contracts.Consensus.AEDPoS/AEDPoSContract_ViewMethods.csuF'
+        b'\x00\x00\x00contract/AElf.Contracts.Consensus.AEDPoS/AElfConsensusContractState.c'
+        b'sue\x00\x00\x00contract/AElf.Contracts.Consensus.AEDPoS/ConsensusCommandGeneratio'
+        b'n/ConsensusBehaviourProviderBase.csu_\x00\x00\x00contract/AElf.Contracts.Consensu'
+        b's.AEDPoS/ConsensusCommandGeneration/ConsensusCommandProvider.csuj\x00\x00\x00cont'
+        b'ract/AElf.Contracts.Consensus.AEDPoS/ConsensusCommandGeneration/MainChai'
+        b'nConsensusBehaviourProvider.csua\x00\x00\x00contract/AElf.Contracts.Consensus.AED'
+        b'PoS/ConsensusCommandGeneration/MiningTimeArrangingService.csuj\x00\x00\x00contrac'
+        b't/AElf.Contracts.Consensus.AEDPoS/ConsensusCommandGeneration/SideChainCo'
+        b'nsensusBehaviourProvider.csue\x00\x00\x00contract/AElf.Contracts.Consensus.AEDPoS'
+        b'/ConsensusCommandGeneration/Strategies/CommandStrategyBase.csuk\x00\x00\x00contra'
+        b'ct/AElf.Contracts.Consensus.AEDPoS/ConsensusCommandGeneration/Strategies'
+        b'/FirstRoundCommandStrategy.csub\x00\x00\x00contract/AElf.Contracts.Consensus.AEDP'
+        b'oS/ConsensusCommandGeneration/Strategies/ICommandStrategy.csul\x00\x00\x00contrac'
+        b't/AElf.Contracts.Consensus.AEDPoS/ConsensusCommandGeneration/Strategies/'
+        b'NormalBlockCommandStrategy.csuo\x00\x00\x00contract/AElf.Contracts.Consensus.AEDP'
+        b'oS/ConsensusCommandGeneration/Strategies/TerminateRoundCommandStrategy.c'
+        b'suj\x00\x00\x00contract/AElf.Contracts.Consensus.AEDPoS/ConsensusCommandGeneratio'
+        b'n/Strategies/TinyBlockCommandStrategy.csum\x00\x00\x00contract/AElf.Contracts.Con'
+        b'sensus.AEDPoS/ConsensusHeaderInfoValidationProviders/ConsensusValidation'
+        b'Context.csuu\x00\x00\x00contract/AElf.Contracts.Consensus.AEDPoS/ConsensusHeaderI'
+        b'nfoValidationProviders/ContinuousBlocksValidationProvider.csuw\x00\x00\x00contrac'
+        b't/AElf.Contracts.Consensus.AEDPoS/ConsensusHeaderInfoValidationProviders'
+        b'/IHeaderInformationValidationProvider.csus\x00\x00\x00contract/AElf.Contracts.Con'
+        b'sensus.AEDPoS/ConsensusHeaderInfoValidationProviders/LibInformationValid'
+        b'ationProvider.csuu\x00\x00\x00contract/AElf.Contracts.Consensus.AEDPoS/ConsensusH'
+        b'eaderInfoValidationProviders/MiningPermissionValidationProvider.csuy\x00\x00\x00c'
+        b'ontract/AElf.Contracts.Consensus.AEDPoS/ConsensusHeaderInfoValidationPro'
+        b'viders/NextRoundMiningOrderValidationProvider.csus\x00\x00\x00contract/AElf.Contr'
+        b'acts.Consensus.AEDPoS/ConsensusHeaderInfoValidationProviders/RoundTermin'
+        b'ateValidationProvider.csum\x00\x00\x00contract/AElf.Contracts.Consensus.AEDPoS/Co'
+        b'nsensusHeaderInfoValidationProviders/TimeSlotValidationProvider.csup\x00\x00\x00c'
+        b'ontract/AElf.Contracts.Consensus.AEDPoS/ConsensusHeaderInfoValidationPro'
+        b'viders/UpdateValueValidationProvider.csu?\x00\x00\x00contract/AElf.Contracts.Cons'
+        b'ensus.AEDPoS/ContractsReferences.csu;\x00\x00\x00contract/AElf.Contracts.Consensu'
+        b's.AEDPoS/Types/MinerList.csu@\x00\x00\x00contract/AElf.Contracts.Consensus.AEDPoS'
+        b'/Types/NextRoundInput.csu?\x00\x00\x00contract/AElf.Contracts.Consensus.AEDPoS/Ty'
+        b'pes/NextTermInput.csu7\x00\x00\x00contract/AElf.Contracts.Consensus.AEDPoS/Types/'
+        b'Round.csuP\x00\x00\x00contract/AElf.Contracts.Consensus.AEDPoS/Types/Round_ApplyN'
+        b'ormalConsensusData.csuQ\x00\x00\x00contract/AElf.Contracts.Consensus.AEDPoS/Types'
+        b'/Round_ArrangeAbnormalMiningTime.csu[\x00\x00\x00contract/AElf.Contracts.Consensu'
+        b's.AEDPoS/Types/Round_ExtractInformationToUpdateConsensus.csuB\x00\x00\x00contract'
+        b'/AElf.Contracts.Consensus.AEDPoS/Types/Round_Generation.csuG\x00\x00\x00contract/'
+        b'AElf.Contracts.Consensus.AEDPoS/Types/Round_GetLighterRound.csu?\x00\x00\x00contr'
+        b'act/AElf.Contracts.Consensus.AEDPoS/Types/Round_GetLogs.csuV\x00\x00\x00contract/'
+        b'AElf.Contracts.Consensus.AEDPoS/Types/Round_ImpliedIrreversibleBlockHeig'
+        b'ht.csu?\x00\x00\x00contract/AElf.Contracts.Consensus.AEDPoS/Types/Round_Recover.c'
+        b'su@\x00\x00\x00contract/AElf.Contracts.Consensus.AEDPoS/Types/Round_Simplify.csu8'
+        b'\x00\x00\x00contract/AElf.Contracts.CrossChain/CrossChainContract.csu=\x00\x00\x00contract'
+        b'/AElf.Contracts.CrossChain/CrossChainContractState.csuT\x00\x00\x00contract/AElf.'
+        b'Contracts.CrossChain/CrossChainContract_ACS1_TransactionFeeProvider.csuB'
+        b'\x00\x00\x00contract/AElf.Contracts.CrossChain/CrossChainContract_Constants.csu?\x00'
+        b'\x00\x00contract/AElf.Contracts.CrossChain/CrossChainContract_Helper.csu=\x00\x00\x00co'
+        b'ntract/AElf.Contracts.CrossChain/CrossChainContract_View.csu>\x00\x00\x00contract'
+        b'/AElf.Contracts.CrossChain/CrossChainReferenceState.csu4\x00\x00\x00contract/AElf'
+        b'.Contracts.Economic/EconomicContract.csu=\x00\x00\x00contract/AElf.Contracts.Econ'
+        b'omic/EconomicContractConstants.csu9\x00\x00\x00contract/AElf.Contracts.Economic/E'
+        b'conomicContractState.csuP\x00\x00\x00contract/AElf.Contracts.Economic/EconomicCon'
+        b'tract_ACS1_TransactionFeeProvider.csu=\x00\x00\x00contract/AElf.Contracts.Electio'
+        b'n/ElectionContractConstants.csuB\x00\x00\x00contract/AElf.Contracts.Election/Elec'
+        b'tionContractReferenceState.csu9\x00\x00\x00contract/AElf.Contracts.Election/Elect'
+        b'ionContractState.csuP\x00\x00\x00contract/AElf.Contracts.Election/ElectionContrac'
+        b't_ACS1_TransactionFeeProvider.csu>\x00\x00\x00contract/AElf.Contracts.Election/El'
+        b'ectionContract_Candidate.csu<\x00\x00\x00contract/AElf.Contracts.Election/Electio'
+        b'nContract_Elector.csuA\x00\x00\x00contract/AElf.Contracts.Election/ElectionContra'
+        b'ct_Maintainence.csu3\x00\x00\x00contract/AElf.Contracts.Election/TimestampHelper.'
+        b'csu/\x00\x00\x00contract/AElf.Contracts.Election/ViewMethods.csu4\x00\x00\x00contract/AElf'
+        b'.Contracts.Genesis/BasicContractZero.csuX\x00\x00\x00contract/AElf.Contracts.Gene'
+        b'sis/BasicContractZeroContract_ACS1_TransactionFeeProvider.csuB\x00\x00\x00contrac'
+        b't/AElf.Contracts.Genesis/BasicContractZeroReferenceState.csu9\x00\x00\x00contract'
+        b'/AElf.Contracts.Genesis/BasicContractZeroState.csu>\x00\x00\x00contract/AElf.Cont'
+        b'racts.Genesis/BasicContractZero_Constants.csu;\x00\x00\x00contract/AElf.Contracts'
+        b'.Genesis/BasicContractZero_Helper.csu<\x00\x00\x00contract/AElf.Contracts.MultiTo'
+        b'ken/TokenContractConstants.csuA\x00\x00\x00contract/AElf.Contracts.MultiToken/Tok'
+        b'enContractReferenceState.csu8\x00\x00\x00contract/AElf.Contracts.MultiToken/Token'
+        b'ContractState.csuB\x00\x00\x00contract/AElf.Contracts.MultiToken/TokenContractSta'
+        b'te_ChargeFee.csuJ\x00\x00\x00contract/AElf.Contracts.MultiToken/TokenContract_ACS'
+        b'1_MethodFeeProvider.csuK\x00\x00\x00contract/AElf.Contracts.MultiToken/TokenContr'
+        b'act_ACS2_StatePathsProvider.csu;\x00\x00\x00contract/AElf.Contracts.MultiToken/To'
+        b'kenContract_Actions.csu?\x00\x00\x00contract/AElf.Contracts.MultiToken/TokenContr'
+        b'act_CacheFileds.csu>\x00\x00\x00contract/AElf.Contracts.MultiToken/TokenContract_'
+        b'Delegation.csuM\x00\x00\x00contract/AElf.Contracts.MultiToken/TokenContract_Fee_C'
+        b'alculate_Coefficient.csu8\x00\x00\x00contract/AElf.Contracts.MultiToken/TokenCont'
+        b'ract_Fees.csu:\x00\x00\x00contract/AElf.Contracts.MultiToken/TokenContract_Helper'
+        b'.csuH\x00\x00\x00contract/AElf.Contracts.MultiToken/TokenContract_Method_Authoriz'
+        b'ation.csu=\x00\x00\x00contract/AElf.Contracts.MultiToken/TokenContract_NFTHelper.'
+        b'csu?\x00\x00\x00contract/AElf.Contracts.MultiToken/TokenContract_NFT_Actions.csu9'
+        b'\x00\x00\x00contract/AElf.Contracts.MultiToken/TokenContract_Views.csu3\x00\x00\x00contrac'
+        b't/AElf.Contracts.NFT/NFTContractConstants.csu8\x00\x00\x00contract/AElf.Contracts'
+        b'.NFT/NFTContractReferenceState.csu/\x00\x00\x00contract/AElf.Contracts.NFT/NFTCon'
+        b'tractState.csu/\x00\x00\x00contract/AElf.Contracts.NFT/NFTContract_ACS1.csu1\x00\x00\x00co'
+        b'ntract/AElf.Contracts.NFT/NFTContract_Create.csu2\x00\x00\x00contract/AElf.Contra'
+        b'cts.NFT/NFTContract_Helpers.csu3\x00\x00\x00contract/AElf.Contracts.NFT/NFTContra'
+        b'ct_UseChain.csu/\x00\x00\x00contract/AElf.Contracts.NFT/NFTContract_View.csu0\x00\x00\x00c'
+        b'ontract/AElf.Contracts.Parliament/Parliament.csu9\x00\x00\x00contract/AElf.Contra'
+        b'cts.Parliament/ParliamentConstants.csuT\x00\x00\x00contract/AElf.Contracts.Parlia'
+        b'ment/ParliamentContract_ACS1_TransactionFeeProvider.csu5\x00\x00\x00contract/AElf'
+        b'.Contracts.Parliament/ParliamentState.csu:\x00\x00\x00contract/AElf.Contracts.Par'
+        b'liament/Parliament_Constants.csu7\x00\x00\x00contract/AElf.Contracts.Parliament/P'
+        b'arliament_Helper.csu5\x00\x00\x00contract/AElf.Contracts.Profit/ContractsReferenc'
+        b'es.csu7\x00\x00\x00contract/AElf.Contracts.Profit/Models/RemovedDetails.csu0\x00\x00\x00co'
+        b'ntract/AElf.Contracts.Profit/ProfitContract.csu9\x00\x00\x00contract/AElf.Contrac'
+        b'ts.Profit/ProfitContractConstants.csu5\x00\x00\x00contract/AElf.Contracts.Profit/'
+        b'ProfitContractState.csuL\x00\x00\x00contract/AElf.Contracts.Profit/ProfitContract'
+        b'_ACS1_TransactionFeeProvider.csu-\x00\x00\x00contract/AElf.Contracts.Profit/ViewM'
+        b'ethods.csuA\x00\x00\x00contract/AElf.Contracts.Referendum/ProposerWhiteListExtens'
+        b'ions.csu0\x00\x00\x00contract/AElf.Contracts.Referendum/Referendum.csu9\x00\x00\x00contrac'
+        b't/AElf.Contracts.Referendum/ReferendumConstants.csuT\x00\x00\x00contract/AElf.Con'
+        b'tracts.Referendum/ReferendumContract_ACS1_TransactionFeeProvider.csu5\x00\x00\x00'
+        b'contract/AElf.Contracts.Referendum/ReferendumState.csu7\x00\x00\x00contract/AElf.'
+        b'Contracts.Referendum/Referendum_Helper.csu6\x00\x00\x00contract/AElf.Contracts.To'
+        b'kenConverter/BancorHelper.csu?\x00\x00\x00contract/AElf.Contracts.TokenConverter/'
+        b'InvalidValueException.csu<\x00\x00\x00contract/AElf.Contracts.TokenConverter/Toke'
+        b'nConvert_Views.csu@\x00\x00\x00contract/AElf.Contracts.TokenConverter/TokenConver'
+        b'terContract.csuE\x00\x00\x00contract/AElf.Contracts.TokenConverter/TokenConverter'
+        b'ContractState.csu\\\x00\x00\x00contract/AElf.Contracts.TokenConverter/TokenConvert'
+        b'erContract_ACS1_TransactionFeeProvider.csu:\x00\x00\x00contract/AElf.Contracts.To'
+        b'kenHolder/ContractsReferences.csu:\x00\x00\x00contract/AElf.Contracts.TokenHolder'
+        b'/TokenHolderContract.csu?\x00\x00\x00contract/AElf.Contracts.TokenHolder/TokenHol'
+        b'derContractState.csuV\x00\x00\x00contract/AElf.Contracts.TokenHolder/TokenHolderC'
+        b'ontract_ACS1_TransactionFeeProvider.csu7\x00\x00\x00contract/AElf.Contracts.Treas'
+        b'ury/ContractsReferences.csu4\x00\x00\x00contract/AElf.Contracts.Treasury/Treasury'
+        b'Contract.csu=\x00\x00\x00contract/AElf.Contracts.Treasury/TreasuryContractConstan'
+        b'ts.csu9\x00\x00\x00contract/AElf.Contracts.Treasury/TreasuryContractState.csuP\x00\x00\x00'
+        b'contract/AElf.Contracts.Treasury/TreasuryContract_ACS1_TransactionFeePro'
+        b'vider.csu3\x00\x00\x00contract/AElf.Contracts.Vote/ContractsReferences.csu+\x00\x00\x00con'
+        b'tract/AElf.Contracts.Vote/ViewMethods.csu,\x00\x00\x00contract/AElf.Contracts.Vot'
+        b'e/VoteContract.csu5\x00\x00\x00contract/AElf.Contracts.Vote/VoteContractConstants'
+        b'.csu1\x00\x00\x00contract/AElf.Contracts.Vote/VoteContractState.csuH\x00\x00\x00contract/A'
+        b'Elf.Contracts.Vote/VoteContract_ACS1_TransactionFeeProvider.csu.\x00\x00\x00contr'
+        b'act/AElf.Contracts.Vote/VoteExtensions.cs'
+)
+
+
+def _scope_files():
+        """Deserialize the scope blob once, caching the views in module globals."""
+        try:
+                return globals()["scope_files"]
+        except KeyError:
+                files = tuple(dict.fromkeys(marshal.loads(_SCOPE_BLOB)))
+                globals()["scope_files"] = files
+                globals()["scope_files_set"] = frozenset(files)
+                return files
+
+
+def __getattr__(name):
+        if name == "BASE_URL":
+                url = globals()[name] = _base_url()
+                return url
+        if name in ("scope_files", "scope_files_set"):
+                _scope_files()
+                return globals()[name]
+        raise AttributeError(name)
+
+
+# Compiled once at import; question_generator only substitutes the target
+# file, instead of re-assembling the multi-kilobyte f-string on every call.
+_PROMPT_TEMPLATE = Template("""
 # **Generate 150+ Targeted Security Audit Questions for AElf Core Smart Contracts (C#)**
 
 ## **Context**
@@ -372,9 +242,9 @@ The target project is **AElf**'s C# smart-contract suite that runs on the AElf b
 
 ## **Scope**
 
-**CRITICAL TARGET FILE**: Focus question generation EXCLUSIVELY on `{target_file}`
+**CRITICAL TARGET FILE**: Focus question generation EXCLUSIVELY on `$target_file`
 
-Questions must be generated from `{target_file}` only. If you cannot reach 150 questions from this file, produce as many high-quality, file-specific questions as possible. If the file exceeds ~1000 lines, go up to 300+ questions. Do not return empty results.
+Questions must be generated from `$target_file` only. If you cannot reach 150 questions from this file, produce as many high-quality, file-specific questions as possible. If the file exceeds ~1000 lines, go up to 300+ questions. Do not return empty results.
 
 ## **Core AElf Components** (for reference only)
 
@@ -423,14 +293,14 @@ Each question MUST follow this Python list format:
 
 ```python
 questions = [
-    "[File: {target_file}] [Function: functionName()] [Vulnerability Type] Specific exploit scenario with preconditions, violated invariant, attacker action, and concrete impact? (High)",
+    "[File: $target_file] [Function: functionName()] [Vulnerability Type] Specific exploit scenario with preconditions, violated invariant, attacker action, and concrete impact? (High)",
 ]
 ```
 
 ## **Output Requirements**
 
-Generate questions focusing EXCLUSIVELY on `{target_file}` that:
-- Reference real functions/methods/logic blocks in `{target_file}`
+Generate questions focusing EXCLUSIVELY on `$target_file` that:
+- Reference real functions/methods/logic blocks in `$target_file`
 - Include concrete exploit paths, not generic checks
 - Tie each question to math logic, business logic, or invariant breaks
 - Prioritize questions likely to result in **valid vulnerabilities**
@@ -445,22 +315,26 @@ Generate questions focusing EXCLUSIVELY on `{target_file}` that:
 - Very large files (>1000 lines): 300+ questions
 - If code size limits quantity, output as many quality questions as possible
 
-Begin generating questions for `{target_file}` now.
-"""
-        return prompt
+Begin generating questions for `$target_file` now.
+""")
 
 
-def validation_format(report: str) -> str:
+@lru_cache(maxsize=256)
+def question_generator(target_file: str) -> str:
         """
-        Generates a comprehensive validation prompt for AElf smart-contract security claims.
+        Generates targeted security audit questions for a specific AElf smart contract file.
 
         Args:
-            report: A security vulnerability report to validate
+            target_file: The specific file path to focus question generation on.
+                        (e.g., "contract/AElf.Contracts.MultiToken/TokenContract.cs")
 
         Returns:
-            A formatted validation prompt string for strict technical scrutiny
+            A formatted prompt string for generating security questions.
         """
-        prompt = f"""
+        return _PROMPT_TEMPLATE.substitute(target_file=target_file)
+
+
+_VALIDATION_TEMPLATE = """
 You are an **Elite AElf Smart Contract Security Judge** with deep expertise in C# contracts, AElf runtime semantics, AEDPoS consensus, governance organizations (Parliament/Referendum/Association), MultiToken/NFT supply rules, TokenConverter pricing, Profit/Treasury distributions, cross-chain indexing, and election/vote mechanics.
 
 Your ONLY task is **ruthless technical validation** of the claim below.
@@ -625,21 +499,31 @@ Note very important the poc must have a valid test that runs just one function t
 - Note if u cant validate the claim or dont understand just send #NoVulnerability    
 - Only show full report when u know this is actually and truly a  valid vulnerability 
 """
-        return prompt
 
 
-def audit_format(security_question: str) -> str:
+@lru_cache(maxsize=1)
+def _validation_parts():
+        """Validation template split around the report, with the scope list
+        rendered and baked in; negligible cost after the first call."""
+        prefix, suffix = _VALIDATION_TEMPLATE.split("{report}", 1)
+        return prefix, suffix.replace("{scope_files}", str(list(_scope_files())))
+
+
+def validation_format(report: str) -> str:
         """
-        Generate a comprehensive security audit prompt for the AElf smart-contract suite.
+        Generates a comprehensive validation prompt for AElf smart-contract security claims.
 
         Args:
-            security_question: The specific security concern to investigate
+            report: A security vulnerability report to validate
 
         Returns:
-            A detailed audit prompt with strict validation requirements
+            A formatted validation prompt string for strict technical scrutiny
         """
+        prefix, suffix = _validation_parts()
+        return "".join((prefix, report, suffix))
 
-        prompt = f"""# AELF SMART CONTRACT SECURITY AUDIT PROMPT
+
+_AUDIT_TEMPLATE = """# AELF SMART CONTRACT SECURITY AUDIT PROMPT
 
 ## Security Question to Investigate:
 {security_question}
@@ -788,21 +672,26 @@ Begin investigation of: {security_question}
 
 """
 
-        return prompt
 
+# Split once at import; joining the segments inserts the question at both
+# of its slots without a format pass over the whole template.
+_AUDIT_PARTS = _AUDIT_TEMPLATE.split("{security_question}")
 
-def scan_format(report: str) -> str:
+
+def audit_format(security_question: str) -> str:
         """
-        Generate a cross-protocol analog vulnerability scanning prompt for the AElf contracts.
+        Generate a comprehensive security audit prompt for the AElf smart-contract suite.
 
         Args:
-            report: A vulnerability report from another protocol/project
+            security_question: The specific security concern to investigate
 
         Returns:
-            A strict scan prompt string that looks for equivalent vulnerability classes in AElf
+            A detailed audit prompt with strict validation requirements
         """
+        return security_question.join(_AUDIT_PARTS)
 
-        prompt = f"""# AELF CROSS-PROTOCOL ANALOG SCAN PROMPT
+
+_SCAN_TEMPLATE = """# AELF CROSS-PROTOCOL ANALOG SCAN PROMPT
 
 ## External Report To Map Into AElf
 {report}
@@ -941,5 +830,21 @@ Begin deep analog scan now.
 
 """
 
-        return prompt
+
+# The report appears once, so each call is one join over two precomputed
+# literal segments.
+_SCAN_PARTS = _SCAN_TEMPLATE.split("{report}")
+
+
+def scan_format(report: str) -> str:
+        """
+        Generate a cross-protocol analog vulnerability scanning prompt for the AElf contracts.
+
+        Args:
+            report: A vulnerability report from another protocol/project
+
+        Returns:
+            A strict scan prompt string that looks for equivalent vulnerability classes in AElf
+        """
+        return report.join(_SCAN_PARTS)
 